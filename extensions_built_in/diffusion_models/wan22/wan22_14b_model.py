@@ -221,6 +221,12 @@ class Wan2214bModel(Wan21):
             return 2
         return 1
 
+    @classmethod
+    def get_prefetch_files(cls, model_config: ModelConfig):
+        files = super().get_prefetch_files(model_config)
+        files.append((model_config.name_or_path, ["transformer_2/*.json", "transformer_2/*.safetensors"]))
+        return files
+
     def load_model(self):
         # load model from patent parent. Wan21 not immediate parent
         # super().load_model()
@@ -2,7 +2,6 @@ import os
 os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
 os.environ["NO_ALBUMENTATIONS_UPDATE"] = "1"
 import sys
-from typing import Union, OrderedDict
 from dotenv import load_dotenv
 # Load the .env file if it exists
 load_dotenv()
@@ -20,14 +19,16 @@ if os.environ.get("DEBUG_TOOLKIT", "0") == "1":
     import torch
     torch.autograd.set_detect_anomaly(True)
 import argparse
-from toolkit.job import get_job
-from toolkit.accelerator import get_accelerator
-from toolkit.print import print_acc, setup_log_to_file
+import signal
+import threading
 
-accelerator = get_accelerator()
+# toolkit imports pull in torch, accelerate and diffusers. They are deferred
+# into main() so `run.py --help` and argparse errors return without paying for them.
 
 
-def print_end_message(jobs_completed, jobs_failed):
+def print_end_message(jobs_completed, jobs_failed, accelerator):
+    from toolkit.print import print_acc
+
     if not accelerator.is_main_process:
         return
     failure_string = f"{jobs_failed} failure{'' if jobs_failed == 1 else 's'}" if jobs_failed > 0 else ""
@@ -43,6 +44,14 @@ def print_end_message(jobs_completed, jobs_failed):
     print_acc("========================================")
 
 
+class JobTerminated(KeyboardInterrupt):
+    pass
+
+
+def raise_job_terminated(signum, frame):
+    raise JobTerminated()
+
+
 def main():
     parser = argparse.ArgumentParser()
 
@@ -75,8 +84,25 @@ def main():
         default=None,
         help='Log file to write output to'
     )
+
+    parser.add_argument(
+        '--prefetch',
+        action='store_true',
+        help='Download the hub models for the queued jobs in the background while the first one runs'
+    )
     args = parser.parse_args()
-    
+
+    from toolkit.job import get_job, get_job_prefetch_files, prefetch_files
+    from toolkit.accelerator import get_accelerator
+    from toolkit.print import print_acc, setup_log_to_file
+
+    accelerator = get_accelerator()
+
+    # SIGTERM (docker stop, systemd) goes through the ctrl+c path so the job gets
+    # its on_error call, which is what records the stop. Then the run exits even
+    # with --recover instead of starting the next config
+    signal.signal(signal.SIGTERM, raise_job_terminated)
+
     if args.log is not None:
         setup_log_to_file(args.log)
 
@@ -84,36 +110,75 @@ def main():
     if len(config_file_list) == 0:
         raise Exception("You must provide at least one config file")
 
-    jobs_completed = 0
-    jobs_failed = 0
-
     if accelerator.is_main_process:
         print_acc(f"Running {len(config_file_list)} job{'' if len(config_file_list) == 1 else 's'}")
 
-    for config_file in config_file_list:
-        try:
-            job = get_job(config_file, args.name)
-            job.run()
-            job.cleanup()
-            jobs_completed += 1
-        except Exception as e:
-            print_acc(f"Error running job: {e}")
-            jobs_failed += 1
+    # download the models for the queued jobs one repo at a time in a daemon
+    # thread. It shares bandwidth with the first job while that one loads, which
+    # is why it is opt in. Jobs still run one at a time in order, the hf cache
+    # locks keep a job that starts before its prefetch is done from downloading
+    # the same files twice. Daemon so aborting run.py does not wait on a download.
+    # The files are resolved here, the model class lookup imports the extensions
+    # and should not race the main thread doing the same.
+    prefetch_stop = threading.Event()
+    if args.prefetch and len(config_file_list) > 1 and accelerator.is_local_main_process:
+        files = []
+        for config_file in config_file_list[1:]:
+            try:
+                files.extend(get_job_prefetch_files(config_file, args.name))
+            except Exception as e:
+                print_acc(f"Error getting prefetch files for {config_file}: {e}")
+
+        def prefetch():
             try:
-                job.process[0].on_error(e)
-            except Exception as e2:
-                print_acc(f"Error running on_error: {e2}")
-            if not args.recover:
-                print_end_message(jobs_completed, jobs_failed)
-                raise e
-        except KeyboardInterrupt as e:
+                prefetch_files(files, prefetch_stop)
+            except Exception as e:
+                print_acc(f"Error prefetching: {e}")
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+    jobs_completed = 0
+    jobs_failed = 0
+
+    try:
+        for config_file in config_file_list:
+            # reset so a failure in get_job does not report on the previous job
+            job = None
             try:
-                job.process[0].on_error(e)
-            except Exception as e2:
-                print_acc(f"Error running on_error: {e2}")
-            if not args.recover:
-                print_end_message(jobs_completed, jobs_failed)
-                raise e
+                job = get_job(config_file, args.name)
+                job.run()
+                job.cleanup()
+                jobs_completed += 1
+            except Exception as e:
+                print_acc(f"Error running job: {e}")
+                jobs_failed += 1
+                if job is not None:
+                    try:
+                        job.process[0].on_error(e)
+                    except Exception as e2:
+                        print_acc(f"Error running on_error: {e2}")
+                if not args.recover:
+                    print_end_message(jobs_completed, jobs_failed, accelerator)
+                    raise e
+            except KeyboardInterrupt as e:
+                if job is not None:
+                    try:
+                        job.process[0].on_error(e)
+                    except Exception as e2:
+                        print_acc(f"Error running on_error: {e2}")
+                if isinstance(e, JobTerminated):
+                    if job is not None:
+                        try:
+                            job.cleanup()
+                        except Exception as e2:
+                            print_acc(f"Error running cleanup: {e2}")
+                    print_end_message(jobs_completed, jobs_failed, accelerator)
+                    raise e
+                if not args.recover:
+                    print_end_message(jobs_completed, jobs_failed, accelerator)
+                    raise e
+    finally:
+        prefetch_stop.set()
 
 
 if __name__ == '__main__':
@@ -1,3 +1,5 @@
+import os
+import threading
 from typing import Union, OrderedDict
 
 from toolkit.config import get_config
@@ -42,3 +44,52 @@ def run_job(
     job = get_job(config, name)
     job.run()
     job.cleanup()
+
+
+def get_job_prefetch_files(
+        config: Union[str, dict, OrderedDict],
+        name=None
+):
+    # the hub files the job's models will load, as (repo_id, allow_patterns).
+    # Resolves the model classes, so call it from the main thread
+    from toolkit.config_modules import ModelConfig
+    from toolkit.util.get_model import get_model_class
+
+    config = get_config(config, name)
+    files = []
+    for process in config['config'].get('process', []):
+        model_config = process.get('model', None)
+        if not isinstance(model_config, dict):
+            continue
+        model_config = ModelConfig(**model_config)
+        ModelClass = get_model_class(model_config)
+        if not hasattr(ModelClass, 'get_prefetch_files'):
+            continue
+        for repo_id, allow_patterns in ModelClass.get_prefetch_files(model_config):
+            if not isinstance(repo_id, str) or os.path.exists(repo_id):
+                continue
+            # only 'username/repo_name' is a hub repo
+            if len(repo_id.split("/")) != 2:
+                continue
+            if (repo_id, allow_patterns) not in files:
+                files.append((repo_id, allow_patterns))
+    return files
+
+
+def prefetch_files(
+        files,
+        stop_event: threading.Event = None
+):
+    # downloads files from get_job_prefetch_files into the hf cache so the job
+    # does not have to wait on them when it starts
+    from huggingface_hub import snapshot_download
+    from diffusers import DiffusionPipeline
+
+    for repo_id, allow_patterns in files:
+        if stop_event is not None and stop_event.is_set():
+            return
+        if allow_patterns is None:
+            # diffusers picks the files from_pretrained will read
+            DiffusionPipeline.download(repo_id)
+        else:
+            snapshot_download(repo_id, allow_patterns=allow_patterns)
@@ -5,7 +5,7 @@ import json
 import random
 import shutil
 import typing
-from typing import Optional, Union, List, Literal
+from typing import Optional, Union, List, Literal, Tuple
 import os
 from collections import OrderedDict
 import copy
@@ -103,6 +103,13 @@ class BaseModel:
     # override these in child classes
     arch = None
 
+    # hub files load_model reads as (repo_id, allow_patterns), used to prefetch
+    # queued jobs. allow_patterns None downloads the whole diffusers pipeline.
+    # Models opt in by overriding this with the paths their load_model uses
+    @classmethod
+    def get_prefetch_files(cls, model_config: ModelConfig) -> List[Tuple[str, Optional[List[str]]]]:
+        return []
+
     def __init__(
             self,
             device,
@@ -379,6 +379,22 @@ class Wan21(BaseModel):
 
         return transformer
 
+    @classmethod
+    def get_prefetch_files(cls, model_config: ModelConfig):
+        # same paths as load_model
+        model_path = model_config.name_or_path
+        files = [(model_path, ["transformer/*.json", "transformer/*.safetensors"])]
+        if not os.path.exists(os.path.join(model_path, 'text_encoder')):
+            files.append((
+                "ai-toolkit/umt5_xxl_encoder",
+                ["tokenizer/*", "text_encoder/*.json", "text_encoder/*.safetensors"]
+            ))
+        if cls._wan_vae_path is not None:
+            files.append((cls._wan_vae_path, ["*.json", "*.safetensors"]))
+        elif not os.path.exists(os.path.join(model_path, 'vae')):
+            files.append((model_config.extras_name_or_path, ["vae/*.json", "vae/*.safetensors"]))
+        return files
+
     def load_model(self):
         dtype = self.torch_dtype
         model_path = self.model_config.name_or_path
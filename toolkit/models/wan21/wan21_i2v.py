@@ -301,6 +301,15 @@ class Wan21I2V(Wan21):
         self.image_encoder: CLIPVisionModel = None
         self.image_processor: CLIPImageProcessor = None
 
+    @classmethod
+    def get_prefetch_files(cls, model_config: ModelConfig):
+        files = super().get_prefetch_files(model_config)
+        files.append((
+            model_config.extras_name_or_path,
+            ["image_processor/*", "image_encoder/*.json", "image_encoder/*.safetensors"]
+        ))
+        return files
+
     def load_model(self):
         # call the super class to load most of the model
         super().load_model()
@@ -130,6 +130,15 @@ UNET_IN_CHANNELS = 4  # Stable Diffusion の in_channels は 4 で固定。XLも
 
 class StableDiffusion:
 
+    # hub files load_model reads, see BaseModel.get_prefetch_files
+    @classmethod
+    def get_prefetch_files(cls, model_config: ModelConfig):
+        # flux loads every component of the pipeline repo, the other archs
+        # pull from their own mix of paths so they are left to load_model
+        if model_config.is_flux:
+            return [(model_config.name_or_path, None)]
+        return []
+
     def __init__(
             self,
             device,
@@ -21,7 +21,7 @@ def get_all_models() -> List[BaseModel]:
     extension_folders = ['extensions', 'extensions_built_in']
 
     # This will hold the classes from all extension modules
-    all_model_classes: List[BaseModel] = BUILT_IN_MODELS
+    all_model_classes: List[BaseModel] = list(BUILT_IN_MODELS)
 
     # Iterate over all directories (i.e., packages) in the "extensions" directory
     for sub_dir in extension_folders: